@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Request, Response, status
+from services.portal_service import Asset, PortalService, etag_matches
+
+# Services
+portal_service = PortalService()
+
+router = APIRouter()
+
+
+def send_asset(asset: Asset, request: Request) -> Response:
+    encoding, body, etag = asset.negotiate(request.headers.get("accept-encoding", ""))
+    # no-cache makes clients revalidate every time, which is just a 304 thanks to the ETag.
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=asset.media_type, headers=headers)
+
+
+@router.get("")
+async def landing_page(mac_address: str, request: Request, response: Response):
+    if not portal_service.is_valid_mac(mac_address):
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return {"error": "Invalid MAC address", "success": False}
+    return send_asset(portal_service.landing_page(mac_address), request)
+
+
+@router.get("/assets/{name}")
+async def asset(name: str, request: Request, response: Response):
+    portal_asset = portal_service.get_asset(name)
+    if portal_asset is None:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"error": "Asset does not exist", "success": False}
+    return send_asset(portal_asset, request)
@@ -1,6 +1,7 @@
 import os
 
 import controllers.device_controller as device_controller
+import controllers.portal_controller as portal_controller
 from fastapi import FastAPI
 
 app = FastAPI()
@@ -11,6 +12,7 @@ async def health_check():
 
 # * Routers
 app.include_router(device_controller.router, prefix="/device", tags=["devices"])
+app.include_router(portal_controller.router, prefix="/portal", tags=["portal"])
 
 if __name__ == '__main__':
     if not os.path.exists("database.db"):
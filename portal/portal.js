@@ -0,0 +1,28 @@
+const POLL_INTERVAL = 5000; // Milliseconds
+
+const macAddress = document.body.dataset.macAddress;
+const timeRemaining = document.getElementById("time-remaining");
+
+function format(seconds) {
+    const h = String(Math.floor(seconds / 3600)).padStart(2, "0");
+    const m = String(Math.floor((seconds % 3600) / 60)).padStart(2, "0");
+    const s = String(seconds % 60).padStart(2, "0");
+    return `${h}:${m}:${s}`;
+}
+
+async function poll() {
+    try {
+        const response = await fetch(`/device/get?mac_address=${encodeURIComponent(macAddress)}`);
+        if (response.ok) {
+            const device = await response.json();
+            if (device.time_remaining !== undefined) {
+                timeRemaining.textContent = format(device.time_remaining);
+            }
+        }
+    } catch (e) {
+        // Gateway may be busy; try again on the next tick.
+    }
+}
+
+poll();
+setInterval(poll, POLL_INTERVAL);
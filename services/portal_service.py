@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+import gzip
+import hashlib
+import html
+import logging
+import mimetypes
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional, gzip is always available.
+    brotli = None
+
+log = logging.getLogger("PortalService")
+
+PORTAL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "portal")
+LANDING_PAGE = "index.html"
+LANDING_CACHE_SIZE = 1024  # Rendered landing pages kept in memory, one per MAC address
+MAC_ADDRESS_PATTERN = re.compile(r"^[0-9A-Fa-f]{2}([:-])(?:[0-9A-Fa-f]{2}\1){4}[0-9A-Fa-f]{2}$")
+
+
+@dataclass(frozen=True)
+class Asset:
+    media_type: str
+    etag: str
+    # Encoding name ("identity", "gzip", "br") -> body. Only encodings that are smaller than identity are kept.
+    bodies: dict[str, bytes]
+
+    def negotiate(self, accept_encoding: str):
+        """Returns (encoding, body, etag) for the best encoding the client accepts."""
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.bodies:
+                # Each encoding is a different representation, so it gets its own strong ETag.
+                return encoding, self.bodies[encoding], f'"{self.etag}-{encoding}"'
+        return "identity", self.bodies["identity"], f'"{self.etag}"'
+
+
+def build_asset(body: bytes, media_type: str) -> Asset:
+    bodies = {"identity": body}
+    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+    if len(compressed) < len(body):
+        bodies["gzip"] = compressed
+    if brotli is not None:
+        compressed = brotli.compress(body, quality=11)
+        if len(compressed) < len(body):
+            bodies["br"] = compressed
+    return Asset(
+        media_type=media_type,
+        etag=hashlib.sha256(body).hexdigest()[:32],
+        bodies=bodies,
+    )
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> frozenset:
+    # Clients send the same handful of headers over and over, so parsing is cached.
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        name = name.strip()
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name == "*":
+            accepted.update(("br", "gzip"))
+        elif name:
+            accepted.add(name)
+    return frozenset(accepted)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix still matches.
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+class PortalService:
+    def __init__(self, portal_dir: str = PORTAL_DIR):
+        self.assets: dict[str, Asset] = {}
+        self.template = None
+
+        # Everything is read and compressed once here, requests only do dictionary lookups.
+        for name in sorted(os.listdir(portal_dir)):
+            path = os.path.join(portal_dir, name)
+            if not os.path.isfile(path):
+                continue
+            if name == LANDING_PAGE:
+                with open(path, encoding="utf-8") as f:
+                    self.template = Template(f.read())
+                continue
+            with open(path, "rb") as f:
+                media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                self.assets[name] = build_asset(f.read(), media_type)
+            log.debug("Portal asset %s loaded (%s)", name, ", ".join(self.assets[name].bodies))
+
+        if self.template is None:
+            raise FileNotFoundError(f"{LANDING_PAGE} not found in {portal_dir}")
+
+        self.landing_page = lru_cache(maxsize=LANDING_CACHE_SIZE)(self._render_landing_page)
+
+    def get_asset(self, name: str) -> Asset | None:
+        return self.assets.get(name)
+
+    def is_valid_mac(self, mac_address: str) -> bool:
+        return MAC_ADDRESS_PATTERN.match(mac_address) is not None
+
+    def _render_landing_page(self, mac_address: str) -> Asset:
+        body = self.template.substitute(mac_address=html.escape(mac_address))
+        return build_asset(body.encode("utf-8"), "text/html; charset=utf-8")
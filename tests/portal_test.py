@@ -0,0 +1,82 @@
+import gzip
+
+from fastapi.testclient import TestClient
+
+from main import app
+from controllers.portal_controller import portal_service
+
+# Create a test client
+client = TestClient(app)
+
+# Test data
+TEST_MAC_ADDRESS = "00:11:22:33:44:55"
+
+
+def test_landing_page_renders_mac_address():
+    response = client.get(
+        "/portal", params={"mac_address": TEST_MAC_ADDRESS}, headers={"Accept-Encoding": "identity"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "content-encoding" not in response.headers
+    assert f'data-mac-address="{TEST_MAC_ADDRESS}"' in response.text
+
+
+def test_landing_page_is_cached_per_mac_address():
+    first = portal_service.landing_page(TEST_MAC_ADDRESS)
+    second = portal_service.landing_page(TEST_MAC_ADDRESS)
+    other = portal_service.landing_page("66:77:88:99:AA:BB")
+
+    assert first is second
+    assert first.etag != other.etag
+
+
+def test_landing_page_invalid_mac_address():
+    response = client.get("/portal", params={"mac_address": "<script>"})
+
+    assert response.status_code == 400
+    assert response.json() == {"error": "Invalid MAC address", "success": False}
+
+
+def test_asset_gzip():
+    response = client.get("/portal/assets/portal.js", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"].endswith('-gzip"')
+    # The test client decodes gzip transparently, so compare against the raw asset.
+    asset = portal_service.get_asset("portal.js")
+    assert response.content == asset.bodies["identity"]
+    assert gzip.decompress(asset.bodies["gzip"]) == asset.bodies["identity"]
+
+
+def test_asset_not_modified():
+    headers = {"Accept-Encoding": "gzip"}
+    etag = client.get("/portal/assets/portal.css", headers=headers).headers["etag"]
+
+    response = client.get("/portal/assets/portal.css", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_asset_etag_differs_per_encoding():
+    gzip_response = client.get("/portal/assets/portal.css", headers={"Accept-Encoding": "gzip"})
+
+    response = client.get(
+        "/portal/assets/portal.css",
+        headers={"Accept-Encoding": "identity", "If-None-Match": gzip_response.headers["etag"]},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != gzip_response.headers["etag"]
+
+
+def test_asset_not_found():
+    response = client.get("/portal/assets/missing.js")
+
+    assert response.status_code == 404
+    assert response.json() == {"error": "Asset does not exist", "success": False}